@@ -5,10 +5,19 @@ Licensed under Creative Commons Attribution-NonCommercial 4.0 International (CC
 """
 
 import pandas as pd
+import numpy as np
 import re
 import os
 import time
 import json
+import sys
+import mmap
+import codecs
+import hashlib
+import argparse
+import threading
+from array import array
+from datetime import datetime
 from pathlib import Path
 from difflib import SequenceMatcher
 
@@ -22,6 +31,41 @@ OUTPUT_FILE = "Grading_Results.xlsx"
 SCORING_MODE = "fuzzy"
 # Tolerance: 0.75 allows for typos/letter swaps
 FUZZY_THRESHOLD = 0.75 
+# Character folding during normalization, on top of lowercasing and removing
+# punctuation. "default" keeps umlauts, "de_ascii" also spells them out.
+FOLDING_RULES = {
+    "default": {"ß": "ss"},
+    "de_ascii": {"ß": "ss", "ä": "ae", "ö": "oe", "ü": "ue"},
+}
+FOLDING = "default"
+# Short targets (<= SHORT_WORD_LENGTH characters) need a closer match instead
+SHORT_WORD_LENGTH = 3
+SHORT_WORD_THRESHOLD = 0.85
+# Word timestamps (Gladia JSON with utterances[].words): grade only the words
+# that start inside RESPONSE_WINDOW (seconds, e.g. (0.0, 3.0) = first 3 seconds
+# after the stimulus; None = whole recording) and have at least
+# MIN_WORD_CONFIDENCE (None = all). The found word is reported with its time.
+USE_WORD_TIMESTAMPS = False
+RESPONSE_WINDOW = None
+MIN_WORD_CONFIDENCE = None
+# Calibration ("python evaluate.py --calibrate"): compares the grading against
+# human 0/1 ratings in this column for every combination of the grids below
+HUMAN_RATING_COLUMN = "Human_Rating"
+CALIBRATION_FILE = "Calibration_Results.xlsx"
+THRESHOLD_GRID = [round(0.50 + i * 0.01, 2) for i in range(51)]  # 0.50 ... 1.00
+SHORT_WORD_THRESHOLD_GRID = [0.75, 0.80, 0.85, 0.90, 0.95, 1.00]
+# Progress: the console line is refreshed at most every PROGRESS_INTERVAL seconds,
+# STATUS_FILE (JSON, for monitoring tools) is rewritten every STATUS_INTERVAL seconds
+PROGRESS_INTERVAL = 1.0
+STATUS_FILE = "Grading_Status.json"
+STATUS_INTERVAL = 10.0
+# Transcripts larger than this (bytes) are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# Checkpointing: graded rows are appended to this journal so that an
+# interrupted run can be continued with "python evaluate.py --resume"
+JOURNAL_FILE = "Grading_Results.journal.jsonl"
+CHECKPOINT_ROWS = 1000     # flush after this many graded rows ...
+CHECKPOINT_SECONDS = 30    # ... or after this many seconds, whichever comes first
 
 # ==========================================
 # 2. HELPER FUNCTIONS
@@ -36,40 +80,52 @@ def print_banner():
     print(f" Grading Mode:      {SCORING_MODE}")
     print("="*50 + "\n")
 
+class NormalizationTable(dict):
+    """
+    str.translate table for clean_text: applies the folding rules and removes
+    punctuation (everything PUNCTUATION matches). Filled lazily, so each
+    character is checked against the regex only once per run.
+    """
+
+    PUNCTUATION = re.compile(r'[^\w\säöü]', flags=re.IGNORECASE)
+
+    def __init__(self, folding):
+        super().__init__({ord(char): repl for char, repl in folding.items()})
+
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = None if self.PUNCTUATION.match(char) else codepoint
+        self[codepoint] = value
+        return value
+
+NORMALIZATION_TABLE = NormalizationTable(FOLDING_RULES[FOLDING])
+
+def normalize_words(text):
+    """
+    Lowercases the transcript once and cleans each word once.
+    Returns one cleaned word per word of text.split() (possibly "").
+    """
+    # lower() never creates or removes whitespace, so the words stay aligned
+    return [w.translate(NORMALIZATION_TABLE) for w in text.lower().split()]
+
 def clean_text(text):
     """Cleans text: Lowercase, alphanumeric only (including umlauts)."""
     if not isinstance(text, str):
         return ""
-    text = text.lower().strip()
-    # IMPORTANT: Convert ß to ss so Bus/Buß is recognized e.g. German
-    text = text.replace("ß", "ss")
-    # Allows a-z, 0-9 and äöü. Everything else (punctuation) is removed.
-    text = re.sub(r'[^\w\säöü]', '', text, flags=re.IGNORECASE)
-    # Reduce double spaces
-    text = ' '.join(text.split())
-    return text
+    # IMPORTANT: ß becomes ss (see FOLDING_RULES) so Bus/Buß is recognized e.g. German
+    return ' '.join(text.lower().translate(NORMALIZATION_TABLE).split())
 
-def find_best_match(target_input, actual, mode):
+def score_tokens(target_input, words_orig, words_clean, mode):
     """
-    Sucht das beste Wort im Satz.
-    NEU: Unterstützt mehrere Synonyme, getrennt durch Komma (z.B. "laufen, läuf").
+    Rohe Ähnlichkeit pro Synonym, ohne Schwellenwert, für bereits zerlegte Wörter.
+    Gibt eine Liste von (t_clean, beste Ähnlichkeit, Index des besten Wortes) zurück.
     """
     # 1. Zelle am Komma aufsplitten -> Liste von Zielen erstellen
     # Z.B. "Schubkarre, Karre" -> ["Schubkarre", "Karre"]
     # str(target_input) sichert ab, falls Excel Zahlen (z.B. 2024) sendet
     targets = [t.strip() for t in str(target_input).split(",")]
 
-    # Hier speichern wir das beste Ergebnis aller Varianten (Global für diesen Aufruf)
-    overall_best_word = None
-    overall_best_sim = 0.0
-    overall_points = 0
-
-    actual_words_orig = actual.split()
-    
-    # Wenn Transkript leer ist, sofort raus
-    if not actual_words_orig:
-        return None, 0, 0
-
+    scores = []
     # 2. Jedes Ziel-Wort (Synonym) einzeln prüfen
     for target in targets:
         t_clean = clean_text(target)
@@ -79,11 +135,10 @@ def find_best_match(target_input, actual, mode):
 
         # Lokale Bestwerte nur für DIESES Synonym
         current_target_best_sim = 0.0
-        current_target_best_word = None
+        current_target_best_index = None
         
         # Jedes Wort im Transkript prüfen
-        for w_orig in actual_words_orig:
-            w_clean = clean_text(w_orig)
+        for i, w_clean in enumerate(words_clean):
             current_sim = 0.0
             
             if mode == "strict":
@@ -100,116 +155,553 @@ def find_best_match(target_input, actual, mode):
             # Ist das aktuelle Wort im Satz ähnlicher als das vorige Wort im Satz?
             if current_sim > current_target_best_sim:
                 current_target_best_sim = current_sim
-                current_target_best_word = w_orig 
+                current_target_best_index = i
 
-        # Punkte berechnen für dieses spezifische Synonym
-        current_points = 0
-        if current_target_best_sim >= (FUZZY_THRESHOLD * 100):
-            current_points = 1
-        
-        # Spezialfall kurze Wörter (<= 3 Zeichen)
-        if len(t_clean) <= 3:
-            if current_target_best_sim < 85: 
-                 current_points = 0
-            else:
-                 current_points = 1
+        scores.append((t_clean, current_target_best_sim, current_target_best_index))
+    return scores
+
+def score_synonyms(target_input, actual, mode):
+    """
+    Rohe Ähnlichkeit pro Synonym, ohne Schwellenwert.
+    Gibt eine Liste von (t_clean, beste Ähnlichkeit, bestes Wort) zurück.
+    """
+    actual_words_orig = actual.split()
+    
+    # Wenn Transkript leer ist, sofort raus
+    if not actual_words_orig:
+        return []
+
+    # Transkript nur einmal säubern, nicht für jedes Synonym erneut
+    scores = score_tokens(target_input, actual_words_orig, normalize_words(actual), mode)
+    return [(t_clean, sim, actual_words_orig[i] if i is not None else None)
+            for t_clean, sim, i in scores]
 
-        # 3. Ist dieses Synonym besser als die bisher getesteten Synonyme?
+def to_percent(threshold):
+    """0.85 -> 85.0 (gerundet, da 0.85 * 100 = 85.00000000000001 ergibt)."""
+    return round(threshold * 100, 9)
+
+def award_points(t_clean, sim, threshold=None, short_threshold=None):
+    """Punkte (0/1) für ein Synonym mit Ähnlichkeit sim (0-100)."""
+    if threshold is None:
+        threshold = FUZZY_THRESHOLD
+    if short_threshold is None:
+        short_threshold = SHORT_WORD_THRESHOLD
+
+    # Spezialfall kurze Wörter (<= 3 Zeichen)
+    if len(t_clean) <= SHORT_WORD_LENGTH:
+        return 1 if sim >= to_percent(short_threshold) else 0
+    return 1 if sim >= to_percent(threshold) else 0
+
+def best_synonym(scores):
+    """Das Synonym mit der höchsten Ähnlichkeit (bei Gleichstand das erste), sonst None."""
+    best = None
+    for score in scores:
         # Beispiel: "Karre" hatte 50%, "Schubkarre" hat 90%. Wir nehmen die 90%.
-        if current_target_best_sim > overall_best_sim:
-            overall_best_sim = current_target_best_sim
-            overall_best_word = current_target_best_word
-            overall_points = current_points
+        if score[1] > (best[1] if best else 0.0):
+            best = score
+    return best
+
+def find_best_match(target_input, actual, mode):
+    """
+    Sucht das beste Wort im Satz.
+    NEU: Unterstützt mehrere Synonyme, getrennt durch Komma (z.B. "laufen, läuf").
+    """
+    best = best_synonym(score_synonyms(target_input, actual, mode))
+    if best is None:
+        return None, 0, 0
 
     # Das Beste zurückgeben (gleiches Format wie früher!)
-    return overall_best_word, overall_best_sim, overall_points
+    t_clean, sim, word = best
+    return word, sim, award_points(t_clean, sim)
+
+class TranscriptWords:
+    """
+    Word-level view of Gladia utterances[].words. The arrays (text, start,
+    end, confidence) are only built when first needed.
+    """
+
+    def __init__(self, utterances):
+        self.utterances = utterances
+        self._text = None
+
+    def _materialize(self):
+        text, start, end, confidence = [], [], [], []
+        for utterance in self.utterances:
+            if not isinstance(utterance, dict):
+                continue
+            for word in utterance.get("words") or []:
+                if not isinstance(word, dict):
+                    continue
+                # Gladia puts spaces/punctuation into "word"; keep one entry per token
+                for token in str(word.get("word", word.get("text", ""))).split():
+                    text.append(token)
+                    start.append(word.get("start"))
+                    end.append(word.get("end"))
+                    confidence.append(word.get("confidence"))
+        self._text = text
+        # None -> NaN, so missing values never pass a window/confidence filter
+        self._start = np.array(start, dtype=float)
+        self._end = np.array(end, dtype=float)
+        self._confidence = np.array(confidence, dtype=float)
+        self.utterances = None
+
+    @property
+    def text(self):
+        if self._text is None:
+            self._materialize()
+        return self._text
+
+    @property
+    def start(self):
+        if self._text is None:
+            self._materialize()
+        return self._start
+
+    @property
+    def end(self):
+        if self._text is None:
+            self._materialize()
+        return self._end
 
-def extract_from_json(content):
-    """Extracts pure text from Gladia JSON."""
+    @property
+    def confidence(self):
+        if self._text is None:
+            self._materialize()
+        return self._confidence
+
+    def select(self, window=None, min_confidence=None):
+        """Indices of the words starting inside window and with enough confidence."""
+        keep = np.ones(len(self.text), dtype=bool)
+        if window is not None:
+            keep &= (self.start >= window[0]) & (self.start <= window[1])
+        if min_confidence is not None:
+            keep &= self.confidence >= min_confidence
+        return np.flatnonzero(keep)
+
+def find_text_in_obj(obj):
+    if isinstance(obj, dict):
+        if "full_transcript" in obj and obj["full_transcript"]: return obj["full_transcript"]
+        if "text" in obj and isinstance(obj["text"], str): return obj["text"]
+        if "transcription" in obj: return find_text_in_obj(obj["transcription"])
+        if "result" in obj: return find_text_in_obj(obj["result"])
+        if "utterances" in obj and isinstance(obj["utterances"], list):
+            return " ".join([str(u.get("text", "")) for u in obj["utterances"]])
+    return None
+
+def find_utterances_in_obj(obj):
+    if isinstance(obj, dict):
+        if "utterances" in obj and isinstance(obj["utterances"], list): return obj["utterances"]
+        if "transcription" in obj: return find_utterances_in_obj(obj["transcription"])
+        if "result" in obj: return find_utterances_in_obj(obj["result"])
+    return None
+
+def extract_from_json(content, with_words=False):
+    """
+    Extracts pure text from Gladia JSON.
+    with_words=True returns (text, TranscriptWords or None) instead.
+    """
+    words = None
     try:
         data = json.loads(content)
-        def find_text_in_obj(obj):
-            if isinstance(obj, dict):
-                if "full_transcript" in obj and obj["full_transcript"]: return obj["full_transcript"]
-                if "text" in obj and isinstance(obj["text"], str): return obj["text"]
-                if "transcription" in obj: return find_text_in_obj(obj["transcription"])
-                if "result" in obj: return find_text_in_obj(obj["result"])
-                if "utterances" in obj and isinstance(obj["utterances"], list):
-                    return " ".join([str(u.get("text", "")) for u in obj["utterances"]])
-            return None
         result = find_text_in_obj(data)
-        return result if result else ""
+        if with_words:
+            utterances = find_utterances_in_obj(data)
+            if utterances and any(isinstance(u, dict) and u.get("words") for u in utterances):
+                words = TranscriptWords(utterances)
+        result = result if result else ""
     except:
-        return content
+        result = content
+    return (result, words) if with_words else result
 
-def get_file_content(filepath):
-    """Reads file (txt/json) and handles encoding issues."""
-    content = ""
-    success = False
+# Byte order marks, UTF-32 first (its LE mark starts with the UTF-16 LE one)
+BOMS = [
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+]
+
+# Bytes str.strip() would remove anyway (ASCII whitespace)
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+def decode_text(buffer):
+    """
+    Decodes file bytes (bytes or mmap) in one go: BOM if present, else UTF-8,
+    else latin-1. Line endings and surrounding whitespace as in text mode + strip().
+    """
+    text = None
+    with memoryview(buffer) as view:
+        for bom, encoding in BOMS:
+            if view[:len(bom)] == bom:
+                try:
+                    with view[len(bom):] as body:
+                        text = str(body, encoding)
+                except UnicodeDecodeError:
+                    # Not really a BOM (e.g. latin-1 text starting with "ÿþ"):
+                    # decode the whole buffer as if there was none
+                    pass
+                break
+        if text is None:
+            # Trim whitespace on the bytes, so strip() below does not copy the text
+            start, end = 0, len(view)
+            while start < end and view[start] in ASCII_WHITESPACE:
+                start += 1
+            while end > start and view[end - 1] in ASCII_WHITESPACE:
+                end -= 1
+            with view[start:end] as trimmed:
+                try:
+                    text = str(trimmed, "utf-8")
+                except UnicodeDecodeError:
+                    text = str(trimmed, "latin-1")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text.strip()
+
+def get_file_content(filepath, with_words=False):
+    """
+    Reads file (txt/json) once as bytes (memory-mapped if large) and handles
+    encoding issues without reading it a second time.
+    Returns (text, success, bytes read); with_words=True also returns the
+    word timings of JSON files (or None).
+    """
+    is_json = filepath.suffix.lower() == '.json'
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-            success = True
-    except UnicodeDecodeError:
-        try:
-            with open(filepath, "r", encoding="latin-1") as f:
-                content = f.read().strip()
-                success = True
-        except:
-            return "[FILE UNREADABLE]", False
+        with open(filepath, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                content = decode_text(f.read())
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    content = decode_text(buffer)
+    except OSError:
+        return ("[FILE UNREADABLE]", False, 0, None) if with_words else ("[FILE UNREADABLE]", False, 0)
 
-    if success and filepath.suffix.lower() == '.json':
-        content = extract_from_json(content)
-    return content, success
+    words = None
+    if is_json:
+        # Parsed from the decoded text: json.loads(bytes) would keep the raw
+        # buffer alive while it parses
+        content = extract_from_json(content, with_words=with_words)
+        if with_words:
+            content, words = content
+    return (content, True, size, words) if with_words else (content, True, size)
 
-# ==========================================
-# 3. MAIN PROGRAM
-# ==========================================
+def file_fingerprint(path):
+    """SHA-256 of a file, used to detect a changed Solutions file on resume."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
 
-def main():
-    start_time = time.time()
-    print_banner()
-    
-    if not os.path.exists(EXCEL_FILE):
-        print(f" ERROR: File '{EXCEL_FILE}' not found!")
-        input("\nPress ENTER to exit...")
-        return
+def journal_header():
+    """Settings a journal was written with. All of them must match to resume."""
+    return {
+        "solutions": file_fingerprint(EXCEL_FILE),
+        "mode": SCORING_MODE,
+        "threshold": FUZZY_THRESHOLD,
+        "short_threshold": SHORT_WORD_THRESHOLD,
+        "folding": FOLDING_RULES[FOLDING],
+        "word_timestamps": USE_WORD_TIMESTAMPS,
+        "response_window": list(RESPONSE_WINDOW) if RESPONSE_WINDOW else None,
+        "min_word_confidence": MIN_WORD_CONFIDENCE,
+    }
 
-    try:
-        df = pd.read_excel(EXCEL_FILE)
-        if len(df.columns) < 2: raise ValueError("Too few columns")
-        df.columns.values[0] = "Filename"
-        df.columns.values[1] = "Target_Text"
-    except Exception as e:
-        print(f" Excel Error: {e}")
-        input("\nPress ENTER...")
-        return
+def load_journal(header, results):
+    """
+    Adds the rows already graded by a previous run to results.
+    Returns (transcripts, next_row, valid_bytes) or raises ValueError if the settings changed:
+    transcripts are the texts written so far (index = ID in the journal), rows before
+    next_row are done, and valid_bytes is the length of the intact part of the journal
+    (0 = start a new one).
+    """
+    transcripts = []
+    next_row = 0
+    valid_bytes = 0
+    if not os.path.exists(JOURNAL_FILE):
+        return transcripts, next_row, valid_bytes
+    with open(JOURNAL_FILE, "rb") as f:
+        first = f.readline()
+        if not first.endswith(b"\n"):
+            return transcripts, next_row, valid_bytes
+        if json.loads(first) != header:
+            raise ValueError("Solutions file, mode or threshold changed since the last run")
+        valid_bytes = len(first)
+        for line in f:
+            # Last line may have been cut off by the crash -> this row is graded again
+            if not line.endswith(b"\n"):
+                break
+            entry = json.loads(line)
+            if "text" in entry:
+                transcripts.append(entry["text"])
+            else:
+                result = entry["result"]
+                result["Transcript (Full Sentence)"] = transcripts[entry["transcript"]]
+                results.append_row(result)
+                next_row = entry["row"] + 1
+            valid_bytes += len(line)
+    return transcripts, next_row, valid_bytes
 
-    results = []
-    print(f" Starting evaluation for {len(df)} entries...\n")
+class Journal:
+    """
+    Append-only checkpoint file: one header line, then one JSON line per graded row.
+    Each distinct transcript is written once, before the first row that uses it,
+    and rows refer to it by ID.
+    """
+
+    def __init__(self, header, valid_bytes=0, transcripts=()):
+        if valid_bytes:
+            # Continue behind the last complete line of the previous run
+            self.file = open(JOURNAL_FILE, "r+", encoding="utf-8", newline="\n")
+            self.file.truncate(valid_bytes)
+            self.file.seek(valid_bytes)
+        else:
+            self.file = open(JOURNAL_FILE, "w", encoding="utf-8", newline="\n")
+            self.file.write(json.dumps(header) + "\n")
+        self.transcript_ids = {text: i for i, text in enumerate(transcripts)}
+        self.pending = []
+        self.last_flush = time.time()
+
+    def add(self, row, result):
+        """result: {column: value} as in ResultColumns.COLUMNS."""
+        result = dict(result)
+        transcript = result.pop("Transcript (Full Sentence)")
+        transcript_id = self.transcript_ids.get(transcript)
+        if transcript_id is None:
+            transcript_id = self.transcript_ids[transcript] = len(self.transcript_ids)
+            self.pending.append(json.dumps({"transcript": transcript_id, "text": transcript},
+                                           ensure_ascii=False))
+        self.pending.append(json.dumps({"row": row, "transcript": transcript_id, "result": result},
+                                       ensure_ascii=False))
+        if (len(self.pending) >= CHECKPOINT_ROWS
+                or time.time() - self.last_flush >= CHECKPOINT_SECONDS):
+            self.flush()
+
+    def flush(self):
+        if self.pending:
+            self.file.write("\n".join(self.pending) + "\n")
+            self.pending = []
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.last_flush = time.time()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+class ResultColumns:
+    """
+    Grading results, stored column by column instead of one dict per row:
+    numbers in typed arrays, status as a category code, repeated strings
+    interned and transcripts referenced by ID, so a file graded for several
+    targets in a row is stored only once.
+    """
 
+    COLUMNS = ["Filename", "Target", "Actual (Found Word)", "Transcript (Full Sentence)",
+               "Points", "Similarity (%)", "Status"]
+    STATUSES = ["OK", "MISSING"]
+
+    def __init__(self):
+        self.filenames = []
+        self.targets = []
+        self.found_words = []
+        self.transcripts = []          # index = transcript ID
+        self.transcript_ids = array("q")
+        self.points = array("b")
+        self.similarity = array("d")
+        self.status = array("b")       # index into STATUSES
+        self.frozen = False
+
+    def __len__(self):
+        return len(self.points)
+
+    def append(self, filename, target, found_word, transcript, points, similarity, status):
+        if self.frozen:
+            raise RuntimeError("ResultColumns cannot grow after to_frame()")
+        self.filenames.append(filename)
+        self.targets.append(sys.intern(target))
+        self.found_words.append(sys.intern(found_word))
+        # Consecutive rows of the same file share one transcript
+        if not self.transcripts or self.transcripts[-1] != transcript:
+            self.transcripts.append(transcript)
+        self.transcript_ids.append(len(self.transcripts) - 1)
+        self.points.append(points)
+        self.similarity.append(similarity)
+        self.status.append(self.STATUSES.index(status))
+
+    def append_row(self, row):
+        """Adds a row given as {column: value} (as stored in the journal)."""
+        self.append(*(row[column] for column in self.COLUMNS))
+
+    def row(self, i):
+        """Row i as {column: value}, e.g. for the journal."""
+        return dict(zip(self.COLUMNS, (
+            self.filenames[i], self.targets[i], self.found_words[i],
+            self.transcripts[self.transcript_ids[i]], int(self.points[i]),
+            self.similarity[i], self.STATUSES[self.status[i]],
+        )))
+
+    def to_frame(self):
+        """
+        DataFrame for saving; the numeric arrays are wrapped, not copied.
+        Must be the last call: an array that exports its buffer cannot be resized,
+        so append() raises RuntimeError afterwards.
+        """
+        self.frozen = True
+        return pd.DataFrame({
+            "Filename": self.filenames,
+            "Target": self.targets,
+            "Actual (Found Word)": self.found_words,
+            "Transcript (Full Sentence)": np.array(self.transcripts, dtype=object)[
+                np.frombuffer(self.transcript_ids, dtype=np.int64)],
+            "Points": np.frombuffer(self.points, dtype=np.int8),
+            "Similarity (%)": np.frombuffer(self.similarity, dtype=np.float64),
+            "Status": pd.Categorical.from_codes(
+                np.frombuffer(self.status, dtype=np.int8), categories=self.STATUSES),
+        }, copy=False)
+
+def parse_target(raw_target):
+    """Target cell from Excel -> string ("" for empty cells)."""
+    if pd.isna(raw_target) or str(raw_target).strip().lower() == "nan":
+        return ""
+    return str(raw_target).strip()
+
+def read_transcript(raw_filename):
+    """
+    Finds the transcript (.json preferred over .txt) for a Solutions row.
+    Returns (text, found, bytes read, TranscriptWords or None).
+    """
+    base_name = Path(raw_filename).stem
+    for ext in [".json", ".txt"]:
+        p = TRANSCRIPT_FOLDER / (base_name + ext)
+        if p.exists():
+            if USE_WORD_TIMESTAMPS:
+                actual_raw, found, nbytes, words = get_file_content(p, with_words=True)
+            else:
+                (actual_raw, found, nbytes), words = get_file_content(p), None
+            if found:
+                return actual_raw, True, nbytes, words
+    return "[NOT FOUND]", False, 0, None
+
+def grade_transcript(target, actual_raw, words):
+    """
+    Best synonym for one transcript as (t_clean, similarity, found word) or None.
+    With word timings only the selected words are scored, and the found word
+    gets its start time if known, e.g. "apple @ 1.24s".
+    """
+    if words is None:
+        return best_synonym(score_synonyms(target, actual_raw, SCORING_MODE))
+
+    selected = words.select(RESPONSE_WINDOW, MIN_WORD_CONFIDENCE)
+    tokens = [words.text[i] for i in selected]
+    best = best_synonym(score_tokens(target, tokens, normalize_words(" ".join(tokens)), SCORING_MODE))
+    if best is None:
+        return None
+    t_clean, sim, i = best
+    start = words.start[selected[i]]
+    # Words without a start time (possible when no window is set) are shown bare
+    if np.isnan(start):
+        return t_clean, sim, tokens[i]
+    return t_clean, sim, f"{tokens[i]} @ {start:.2f}s"
+
+class ProgressReporter:
+    """
+    Live progress for long runs: rows/s, MB/s read, cache hit rate, missing
+    files and ETA on one console line, plus STATUS_FILE as JSON.
+    update() only counts; output is rate-limited. Safe to call from several threads.
+    cache_info: optional callable returning functools-style (hits, misses) stats.
+    """
+
+    def __init__(self, total, already_done=0, cache_info=None):
+        self.total = total
+        self.already_done = already_done
+        self.cache_info = cache_info
+        self.rows = 0
+        self.bytes_read = 0
+        self.missing = 0
+        self.start = time.monotonic()
+        self.next_print = self.start + PROGRESS_INTERVAL
+        self.next_status = self.start + STATUS_INTERVAL
+        self.lock = threading.Lock()
+
+    def update(self, rows=1, nbytes=0, missing=0):
+        with self.lock:
+            self.rows += rows
+            self.bytes_read += nbytes
+            self.missing += missing
+            now = time.monotonic()
+            if now >= self.next_print:
+                self.next_print = now + PROGRESS_INTERVAL
+                print("\r " + self.line(self.snapshot(now)), end="", flush=True)
+            if now >= self.next_status:
+                self.next_status = now + STATUS_INTERVAL
+                self.write_status(self.snapshot(now))
+
+    def snapshot(self, now, state="running"):
+        elapsed = now - self.start
+        rate = self.rows / elapsed if elapsed > 0 else 0.0
+        remaining = self.total - self.already_done - self.rows
+        hit_rate = None
+        if self.cache_info is not None:
+            cache = self.cache_info()
+            lookups = cache.hits + cache.misses
+            hit_rate = round(cache.hits / lookups, 3) if lookups else None
+        return {
+            "state": state,
+            "rows_done": self.already_done + self.rows,
+            "rows_total": self.total,
+            "rows_per_sec": round(rate, 1),
+            "mb_read": round(self.bytes_read / 1e6, 2),
+            "mb_per_sec": round(self.bytes_read / 1e6 / elapsed, 2) if elapsed > 0 else 0.0,
+            "cache_hit_rate": hit_rate,
+            "missing_files": self.missing,
+            "elapsed_sec": round(elapsed, 1),
+            "eta_sec": round(remaining / rate, 1) if rate > 0 else None,
+            "updated": datetime.now().isoformat(timespec="seconds"),
+        }
+
+    @staticmethod
+    def line(status):
+        percent = status["rows_done"] / status["rows_total"] * 100 if status["rows_total"] else 100.0
+        cache = f"{status['cache_hit_rate'] * 100:.0f}%" if status["cache_hit_rate"] is not None else "-"
+        eta = f"{status['eta_sec']:.0f}s" if status["eta_sec"] is not None else "-"
+        return (f"{status['rows_done']}/{status['rows_total']} ({percent:.1f}%) | "
+                f"{status['rows_per_sec']:.0f} rows/s | {status['mb_per_sec']:.2f} MB/s | "
+                f"cache {cache} | missing {status['missing_files']} | ETA {eta}   ")
+
+    @staticmethod
+    def write_status(status):
+        # Write to a temp file first so monitoring never reads a half-written file
+        tmp = STATUS_FILE + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(status, f, indent=2)
+            os.replace(tmp, STATUS_FILE)
+        except OSError:
+            pass
+
+    def finish(self, state="finished"):
+        with self.lock:
+            status = self.snapshot(time.monotonic(), state)
+            print("\r " + self.line(status))
+            self.write_status(status)
+
+def grade_rows(df, results, next_row, journal, progress):
+    """Grades every row of the Solutions table from next_row on; earlier rows are already in results."""
     for index, row in df.iterrows():
         raw_filename = str(row["Filename"]).strip()
         
         # Ignore system files starting with underscore
         if raw_filename.startswith("_"):
+            progress.update()
             continue
 
-        raw_target = row["Target_Text"]
-        if pd.isna(raw_target) or str(raw_target).strip().lower() == "nan":
-            target = ""
-        else:
-            target = str(raw_target).strip()
+        row_key = int(index)
+        if row_key < next_row:
+            continue
 
-        base_name = Path(raw_filename).stem
-        found = False
-        actual_raw = "[NOT FOUND]"
-        
-        for ext in [".json", ".txt"]:
-            p = TRANSCRIPT_FOLDER / (base_name + ext)
-            if p.exists():
-                actual_raw, found = get_file_content(p)
-                if found: break
+        target = parse_target(row["Target_Text"])
+        actual_raw, found, nbytes, words = read_transcript(raw_filename)
         
         # Grading
         ist_display = ""
@@ -217,10 +709,11 @@ def main():
         similarity = 0
 
         if found and target:
-            match_word, similarity, points = find_best_match(target, actual_raw, SCORING_MODE)
+            best = grade_transcript(target, actual_raw, words)
             
-            if match_word:
-                ist_display = match_word
+            if best:
+                t_clean, similarity, ist_display = best
+                points = award_points(t_clean, similarity)
             else:
                 ist_display = "-"
         else:
@@ -228,20 +721,202 @@ def main():
             points = 0
             similarity = 0
 
-        results.append({
-            "Filename": raw_filename,
-            "Target": target,
-            "Actual (Found Word)": ist_display,
-            "Transcript (Full Sentence)": actual_raw if found else "[MISSING]",
-            "Points": points,
-            "Similarity (%)": round(similarity, 1),
-            "Status": "OK" if found else "MISSING"
-        })
+        results.append(
+            raw_filename,
+            target,
+            ist_display,
+            actual_raw if found else "[MISSING]",
+            points,
+            round(similarity, 1),
+            "OK" if found else "MISSING",
+        )
+        journal.add(row_key, results.row(-1))
+        progress.update(nbytes=nbytes, missing=0 if found else 1)
+
+# ==========================================
+# 3. CALIBRATION
+# ==========================================
+
+def collect_raw_scores(df, progress):
+    """
+    The single scoring pass of a calibration run.
+    Returns, per row with a human rating: best raw similarity, whether the
+    winning synonym is a short word, and the human rating (bool).
+    """
+    ratings = pd.to_numeric(df[HUMAN_RATING_COLUMN], errors="coerce")
+    sims, short, human = [], [], []
+
+    for raw_filename, raw_target, rating in zip(df["Filename"], df["Target_Text"], ratings):
+        raw_filename = str(raw_filename).strip()
+        if raw_filename.startswith("_") or pd.isna(rating):
+            progress.update()
+            continue
+
+        best = None
+        target = parse_target(raw_target)
+        actual_raw, found, nbytes, words = read_transcript(raw_filename)
+        if found and target:
+            best = grade_transcript(target, actual_raw, words)
+        progress.update(nbytes=nbytes, missing=0 if found else 1)
+
+        sims.append(best[1] if best else 0.0)
+        short.append(best is not None and len(best[0]) <= SHORT_WORD_LENGTH)
+        human.append(rating > 0)
+
+    return np.array(sims), np.array(short, dtype=bool), np.array(human, dtype=bool)
+
+def sweep_thresholds(sims, short, human, thresholds, short_thresholds):
+    """
+    Agreement, precision, recall and Cohen's kappa for every
+    (threshold, short-word threshold) pair, without scoring again.
+    """
+    thresholds = np.asarray(thresholds, dtype=float)
+    short_thresholds = np.asarray(short_thresholds, dtype=float)
+    # Same rule as award_points(); sim == 0 means no synonym matched at all
+    matched = sims > 0
+    long_rows = matched & ~short
+    short_rows = matched & short
+
+    # Long targets only depend on the threshold, short ones only on the
+    # short-word threshold -> count both separately and add them up
+    long_hits = sims[long_rows][:, None] >= np.round(thresholds * 100, 9)
+    short_hits = sims[short_rows][:, None] >= np.round(short_thresholds * 100, 9)
+    pred_pos = long_hits.sum(axis=0)[:, None] + short_hits.sum(axis=0)[None, :]
+    true_pos = (long_hits & human[long_rows][:, None]).sum(axis=0)[:, None] \
+        + (short_hits & human[short_rows][:, None]).sum(axis=0)[None, :]
+
+    n = len(sims)
+    human_pos = human.sum()
+    false_pos = pred_pos - true_pos
+    true_neg = n - human_pos - false_pos
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        agreement = (true_pos + true_neg) / n
+        precision = true_pos / pred_pos
+        recall = true_pos / human_pos
+        expected = (pred_pos / n) * (human_pos / n) + ((n - pred_pos) / n) * ((n - human_pos) / n)
+        kappa = (agreement - expected) / (1 - expected)
+
+    grid_t, grid_s = np.meshgrid(thresholds, short_thresholds, indexing="ij")
+    return pd.DataFrame({
+        "Threshold": grid_t.ravel(),
+        "Short-Word Threshold": grid_s.ravel(),
+        "Points awarded": pred_pos.ravel(),
+        "Agreement (%)": np.round(agreement.ravel() * 100, 1),
+        "Precision": np.round(precision.ravel(), 3),
+        "Recall": np.round(recall.ravel(), 3),
+        "Cohen's Kappa": np.round(kappa.ravel(), 3),
+    })
+
+def run_calibration(df, start_time):
+    """Scores once, then evaluates the whole threshold grid against the human ratings."""
+    if HUMAN_RATING_COLUMN not in df.columns:
+        print(f" ERROR: Column '{HUMAN_RATING_COLUMN}' with human ratings (0/1) not found!")
+        return
+
+    print(f" Calibrating against '{HUMAN_RATING_COLUMN}' for {len(df)} entries...\n")
+    progress = ProgressReporter(len(df))
+    sims, short, human = collect_raw_scores(df, progress)
+    progress.finish()
+    if len(sims) == 0:
+        print(" ERROR: No rows with a human rating.")
+        return
+
+    sweep = sweep_thresholds(sims, short, human, THRESHOLD_GRID, SHORT_WORD_THRESHOLD_GRID)
+    best = sweep.loc[sweep["Cohen's Kappa"].fillna(-1).idxmax()]
+    best_kappa = best["Cohen's Kappa"]
+
+    print("\n" + "="*30)
+    print(f" CALIBRATION")
+    print(f"   Rated rows:      {len(sims)}")
+    print(f"   Combinations:    {len(sweep)}")
+    print(f"   Best threshold:  {best['Threshold']:.2f} (short words: {best['Short-Word Threshold']:.2f})")
+    print(f"   Agreement:       {best['Agreement (%)']:.1f}%")
+    print(f"   Cohen's kappa:   {best_kappa:.3f}")
+    print(f"   Duration:        {time.time() - start_time:.2f} sec")
+    print("="*30)
+
+    try:
+        sweep.to_excel(CALIBRATION_FILE, index=False)
+        print(f"\n Successfully saved to: {CALIBRATION_FILE}")
+    except Exception as e:
+        print(f"\n Error saving file: {e}")
+
+# ==========================================
+# 4. MAIN PROGRAM
+# ==========================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Grades transcripts against Solutions.xlsx")
+    parser.add_argument("--resume", action="store_true",
+                        help=f"skip rows already graded in {JOURNAL_FILE}")
+    parser.add_argument("--calibrate", action="store_true",
+                        help=f"sweep thresholds against the '{HUMAN_RATING_COLUMN}' column")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    print_banner()
+    
+    if not os.path.exists(EXCEL_FILE):
+        print(f" ERROR: File '{EXCEL_FILE}' not found!")
+        input("\nPress ENTER to exit...")
+        return
+
+    try:
+        df = pd.read_excel(EXCEL_FILE)
+        if len(df.columns) < 2: raise ValueError("Too few columns")
+        df.columns.values[0] = "Filename"
+        df.columns.values[1] = "Target_Text"
+    except Exception as e:
+        print(f" Excel Error: {e}")
+        input("\nPress ENTER...")
+        return
+
+    if args.calibrate:
+        run_calibration(df, start_time)
+        input("\n Done. Press ENTER to close...")
+        return
+
+    header = journal_header()
+    results = ResultColumns()
+    transcripts, next_row, valid_bytes = [], 0, 0
+    if args.resume:
+        try:
+            transcripts, next_row, valid_bytes = load_journal(header, results)
+        except ValueError as e:
+            print(f" Cannot resume: {e}.")
+            print(f" Delete '{JOURNAL_FILE}' to start over.")
+            input("\nPress ENTER...")
+            return
+        print(f" Resuming: {len(results)} rows already graded.")
+    elif os.path.exists(JOURNAL_FILE):
+        # Never overwrite the checkpoints of an interrupted run by accident
+        print(f" ERROR: '{JOURNAL_FILE}' from an interrupted run exists.")
+        print(" Run with --resume to continue it, or delete the file to start over.")
+        input("\nPress ENTER...")
+        return
+    journal = Journal(header, valid_bytes, transcripts)
+    del transcripts
+
+    print(f" Starting evaluation for {len(df)} entries...\n")
+
+    progress = ProgressReporter(len(df), already_done=len(results))
+    try:
+        grade_rows(df, results, next_row, journal, progress)
+    except KeyboardInterrupt:
+        progress.finish("interrupted")
+        print(f"\n Interrupted. Progress saved to '{JOURNAL_FILE}'.")
+        print(" Run again with --resume to continue.")
+        return
+    finally:
+        # Checkpoint whatever was graded, also when grading stops with an error
+        journal.close()
+    progress.finish()
 
     # Save Results
-    df_result = pd.DataFrame(results)
-    correct = df_result["Points"].sum()
-    valid_count = len(df_result[df_result["Target"] != ""])
+    df_result = results.to_frame()
+    correct = sum(results.points)
+    valid_count = len(results) - results.targets.count("")
     quote = (correct / valid_count * 100) if valid_count > 0 else 0
     
     print("\n" + "="*30)
@@ -255,6 +930,8 @@ def main():
     try:
         df_result.to_excel(OUTPUT_FILE, index=False)
         print(f"\n Successfully saved to: {OUTPUT_FILE}")
+        # Results are safe on disk, the checkpoint is no longer needed
+        os.remove(JOURNAL_FILE)
     except Exception as e:
         print(f"\n Error saving file: {e}")
 
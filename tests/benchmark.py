@@ -0,0 +1,283 @@
+"""
+TextSimilarityGrader (https://github.com/robomustib/TextSimilarityGrader/)
+Copyright (c) 2026 Mustafa Bilgin
+Licensed under Creative Commons Attribution-NonCommercial 4.0 International (CC BY-NC 4.0)
+"""
+
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# evaluate.py lives in the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import evaluate
+
+# ==========================================
+# SETTINGS
+# ==========================================
+FUZZ_CASES = 200_000
+BENCH_MB = 5
+RESULT_ROWS = 1_000_000
+READ_FILE_MB = 32
+
+# Characters the fuzzer likes to use: umlauts, ß/ẞ, punctuation, odd whitespace,
+# Turkish İ (lowercases to two characters), Greek sigma (context-sensitive lowercase)
+SPECIAL_CHARS = "äöüÄÖÜßẞ.,;:!?-_'\"()[]{}…–—€$%&/\\ \t\n  　İΣσς0123456789"
+WORDS = ["Apfel", "Straße", "BUSS", "Über", "läuft", "Schubkarre", "hello,", "world!",
+         "don't", "ÖL", "naïve", "café", "ΟΔΟΣ", "2024", "e-mail", "Anna..."]
+
+def legacy_clean_text(text):
+    """clean_text as it was before the translate table (reference implementation)."""
+    if not isinstance(text, str):
+        return ""
+    text = text.lower().strip()
+    text = text.replace("ß", "ss")
+    text = re.sub(r'[^\w\säöü]', '', text, flags=re.IGNORECASE)
+    text = ' '.join(text.split())
+    return text
+
+def random_text(rng, length):
+    chars = []
+    for _ in range(length):
+        roll = rng.random()
+        if roll < 0.5:
+            chars.append(rng.choice("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ "))
+        elif roll < 0.85:
+            chars.append(rng.choice(SPECIAL_CHARS))
+        else:
+            # Any code point outside the surrogate range
+            cp = rng.randrange(0x110000)
+            chars.append(chr(cp) if not 0xD800 <= cp <= 0xDFFF else "?")
+    return "".join(chars)
+
+def random_transcript(rng, n_words):
+    return " ".join(rng.choice(WORDS) if rng.random() < 0.7 else random_text(rng, rng.randint(1, 8))
+                    for _ in range(n_words))
+
+# ==========================================
+# NORMALIZATION
+# ==========================================
+
+def fuzz_normalization():
+    """clean_text and normalize_words must give exactly the old results."""
+    rng = random.Random(42)
+    for i in range(FUZZ_CASES):
+        text = random_text(rng, rng.randint(0, 40)) if i % 2 else random_transcript(rng, rng.randint(0, 12))
+        expected = legacy_clean_text(text)
+        if evaluate.clean_text(text) != expected:
+            raise AssertionError(f"clean_text differs for {text!r}")
+        words = [legacy_clean_text(w) for w in text.split()]
+        if evaluate.normalize_words(text) != words:
+            raise AssertionError(f"normalize_words differs for {text!r}")
+
+    # Every single code point once, in both cases
+    for cp in range(0x110000):
+        if 0xD800 <= cp <= 0xDFFF:
+            continue
+        char = chr(cp)
+        for text in (char, "x" + char + "x", char.upper()):
+            if evaluate.clean_text(text) != legacy_clean_text(text):
+                raise AssertionError(f"clean_text differs for U+{cp:04X}")
+    print(f" Fuzz: {FUZZ_CASES} random texts + all code points identical to the old clean_text")
+
+def bench_normalization():
+    """Seconds per MB of transcript text: old per-word cleaning vs. normalize_words."""
+    rng = random.Random(7)
+    transcripts = []
+    size = 0
+    while size < BENCH_MB * 1024 * 1024:
+        text = random_transcript(rng, 40)
+        transcripts.append(text)
+        size += len(text.encode("utf-8"))
+    mb = size / (1024 * 1024)
+
+    start = time.perf_counter()
+    for text in transcripts:
+        [legacy_clean_text(w) for w in text.split()]
+    legacy = (time.perf_counter() - start) / mb
+
+    start = time.perf_counter()
+    for text in transcripts:
+        evaluate.normalize_words(text)
+    new = (time.perf_counter() - start) / mb
+
+    print(f" Normalization: old {legacy:.3f} s/MB, new {new:.3f} s/MB ({legacy / new:.1f}x)")
+    print("   (old code also repeated this once per synonym)")
+
+# ==========================================
+# RESULT STORAGE
+# ==========================================
+
+def result_rows(rng):
+    """RESULT_ROWS fake grading results; every transcript is its own string, as if read from a file."""
+    targets = ["Apple", "Cat, Kat", "Bus", "Library", "Anna"]
+    for i in range(RESULT_ROWS):
+        found = i % 10 != 0
+        transcript = f"participant {i} said: " + " ".join(rng.choice(WORDS) for _ in range(8))
+        yield (f"file_{i}.json", rng.choice(targets), rng.choice(WORDS) if found else "-",
+               transcript if found else "[MISSING]", int(found), round(rng.random() * 100, 1),
+               "OK" if found else "MISSING")
+
+def peak_memory(store):
+    tracemalloc.start()
+    start = time.perf_counter()
+    store(result_rows(random.Random(3)))
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / (1024 * 1024), duration
+
+def store_dicts(rows):
+    """The old way: one dict per row, then DataFrame(list of dicts)."""
+    results = [dict(zip(evaluate.ResultColumns.COLUMNS, row)) for row in rows]
+    return evaluate.pd.DataFrame(results)
+
+def store_columns(rows):
+    results = evaluate.ResultColumns()
+    for row in rows:
+        results.append(*row)
+    return results.to_frame()
+
+def bench_result_storage():
+    """Peak memory for RESULT_ROWS rows up to the finished DataFrame."""
+    old_mb, old_s = peak_memory(store_dicts)
+    new_mb, new_s = peak_memory(store_columns)
+    print(f" Results ({RESULT_ROWS} rows): dicts {old_mb:.0f} MB peak ({old_s:.1f} s), "
+          f"columns {new_mb:.0f} MB peak ({new_s:.1f} s)")
+
+# ==========================================
+# FILE READING
+# ==========================================
+
+def legacy_get_file_content(filepath):
+    """get_file_content as it was before the byte-level reader (reference implementation)."""
+    try:
+        with open(filepath, "r", encoding="utf-8") as f:
+            content = f.read().strip()
+    except UnicodeDecodeError:
+        with open(filepath, "r", encoding="latin-1") as f:
+            content = f.read().strip()
+    if filepath.suffix.lower() == '.json':
+        content = evaluate.extract_from_json(content)
+    return content, True
+
+def check_file_reading(folder):
+    """Same text as before for every encoding, plus BOM files the old reader got wrong."""
+    text = "  Die Straße, the café and a naïve Bär.\r\nSecond line\r\n"
+    gladia = {"transcription": {"full_transcript": text.strip()}}
+    cases = {
+        "utf8.txt": text.encode("utf-8"),
+        "latin1.txt": text.encode("latin-1"),
+        "utf8.json": json.dumps(gladia, ensure_ascii=False).encode("utf-8"),
+        "latin1.json": json.dumps(gladia, ensure_ascii=False).encode("latin-1"),
+        "broken.json": b'{"text": "Stra\xdfe' + b" \r\n",
+        # Start like a BOM but do not decode in that encoding
+        "fake_bom_utf8.txt": b"\xef\xbb\xbfDie Stra\xdfe",
+        "fake_bom_utf16.txt": b"\xff\xfe\x41",
+        "fake_bom_utf32.txt": b"\xff\xfe\x00\x00\xdf",
+        "fake_bom_utf8.json": b'\xef\xbb\xbf{"text": "Stra\xdfe"}',
+    }
+    for name, data in cases.items():
+        path = folder / name
+        path.write_bytes(data)
+        if evaluate.get_file_content(path)[:2] != legacy_get_file_content(path):
+            raise AssertionError(f"get_file_content differs for {name}")
+
+    # Memory-mapped path (.txt and .json)
+    big = text * (evaluate.MMAP_THRESHOLD // len(text) + 1)
+    for name, data in [("big.txt", big.encode("utf-8")),
+                       ("big.json", json.dumps({"text": big}, ensure_ascii=False).encode("latin-1"))]:
+        path = folder / name
+        path.write_bytes(data)
+        if evaluate.get_file_content(path)[:2] != legacy_get_file_content(path):
+            raise AssertionError(f"get_file_content differs for memory-mapped {name}")
+
+    # BOMs: all encodings must give the same text
+    for encoding, bom in [("utf-8", b"\xef\xbb\xbf"), ("utf-16-le", b"\xff\xfe"), ("utf-16-be", b"\xfe\xff"),
+                          ("utf-32-le", b"\xff\xfe\x00\x00"), ("utf-32-be", b"\x00\x00\xfe\xff")]:
+        for suffix, payload in [(".txt", text), (".json", json.dumps(gladia, ensure_ascii=False))]:
+            path = folder / ("bom_" + encoding + suffix)
+            path.write_bytes(bom + payload.encode(encoding))
+            if evaluate.get_file_content(path)[:2] != (text.strip().replace("\r\n", "\n") if suffix == ".txt"
+                                                   else text.strip(), True):
+                raise AssertionError(f"BOM not handled for {path.name}")
+    print(" File reading: identical to the old reader (incl. fake BOMs), BOMs (UTF-8/16/32) detected")
+
+# Runs one reader in a fresh interpreter and reports how far its resident set grew,
+# which includes memory-mapped pages (tracemalloc does not see them). Linux only:
+# ru_maxrss is inherited from this process, so the high-water mark is reset instead.
+MEASURE_READ = """
+import sys, time
+from pathlib import Path
+sys.path.insert(0, {tests!r})
+import benchmark
+def status(key):
+    with open("/proc/self/status") as f:
+        return int(f.read().split(key + ":")[1].split()[0]) * 1024
+reader = {{"old": benchmark.legacy_get_file_content, "new": benchmark.evaluate.get_file_content}}[{reader!r}]
+with open("/proc/self/clear_refs", "w") as f:
+    f.write("5")
+before = status("VmRSS")
+start = time.perf_counter()
+reader(Path({path!r}))
+duration = time.perf_counter() - start
+print(duration, status("VmHWM") - before)
+"""
+
+def measure_read(reader, path):
+    """Seconds and peak RSS growth in bytes for reader ("old" or "new") on path."""
+    code = MEASURE_READ.format(tests=str(Path(__file__).resolve().parent), reader=reader, path=str(path))
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    duration, peak = out.split()
+    return float(duration), int(peak)
+
+def bench_file_reading():
+    """Seconds per GB and peak RSS (incl. memory-mapped pages) per file size, old vs. new reader."""
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = Path(tmp)
+        check_file_reading(folder)
+
+        # Realistic transcript text (umlauts, punctuation), not random code points
+        rng = random.Random(11)
+        words = " ".join(rng.choice(WORDS) for _ in range(10_000))
+        repeat = READ_FILE_MB * 1024 * 1024 // len(words.encode("utf-8")) + 1
+        sentence = (words + "\n") * repeat
+        utterance = {"text": words[:200], "words": [{"word": " " + w, "start": 0.0, "end": 0.1, "confidence": 0.9}
+                                                   for w in words[:200].split()]}
+        gladia = json.dumps({"transcription": {"full_transcript": sentence,
+                                               "utterances": [utterance] * 1000}}, ensure_ascii=False)
+        files = {
+            "UTF-8 .txt": ("utf8.txt", sentence.encode("utf-8")),
+            "latin-1 .txt": ("latin1.txt", sentence.encode("latin-1", errors="replace")),
+            "UTF-8 .json": ("utf8.json", gladia.encode("utf-8")),
+            "latin-1 .json": ("latin1.json", gladia.encode("latin-1", errors="replace")),
+        }
+        for label, (name, data) in files.items():
+            path = folder / name
+            path.write_bytes(data)
+            gb = len(data) / 1024**3
+            old_s, old_peak = measure_read("old", path)
+            new_s, new_peak = measure_read("new", path)
+            print(f" Reading {label} ({len(data) / 1024**2:.0f} MB): "
+                  f"old {old_s / gb:.1f} s/GB, {old_peak / len(data):.1f}x file size peak | "
+                  f"new {new_s / gb:.1f} s/GB, {new_peak / len(data):.1f}x file size peak")
+            path.unlink()
+
+def main():
+    print("="*50)
+    print("   BENCHMARKS")
+    print("="*50)
+    fuzz_normalization()
+    bench_normalization()
+    bench_result_storage()
+    bench_file_reading()
+    print("="*50)
+
+if __name__ == "__main__":
+    main()
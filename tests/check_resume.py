@@ -0,0 +1,103 @@
+"""
+TextSimilarityGrader (https://github.com/robomustib/TextSimilarityGrader/)
+Copyright (c) 2026 Mustafa Bilgin
+Licensed under Creative Commons Attribution-NonCommercial 4.0 International (CC BY-NC 4.0)
+"""
+
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# ==========================================
+# SETTINGS
+# ==========================================
+ROOT = Path(__file__).resolve().parent.parent
+ROWS = 20_000
+CHECKPOINT_ROWS = 100
+KILL_AFTER_ROWS = ROWS // 3
+
+TRANSCRIPTS = {
+    "apple.json": {"transcription": {"full_transcript": "I bought an Appple yesterday."}},
+    "bus.json": {"result": {"transcription": {"utterances": [{"text": "I take the Buss to school"}]}}},
+    "library.json": {"text": "The libary has many books."},
+    "anna.txt": "My name is Anna, nice to meet you.",
+}
+TARGETS = ["Apple", "Bus", "Library, Books", "Anna", "Dog", "Cat, Kat"]
+
+def run_grader(folder, *args):
+    """Starts evaluate.py in folder with a small checkpoint interval (ENTER is pressed at the end)."""
+    code = ("import sys; sys.path.insert(0, {root!r}); import evaluate; "
+            "evaluate.CHECKPOINT_ROWS = {rows}; sys.argv = ['evaluate.py'] + {args!r}; evaluate.main()"
+            ).format(root=str(ROOT), rows=CHECKPOINT_ROWS, args=list(args))
+    return subprocess.Popen([sys.executable, "-c", code], cwd=folder, stdin=subprocess.PIPE,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+def finish(process):
+    _, err = process.communicate("\n")
+    if process.returncode != 0:
+        raise AssertionError(f"Grader failed:\n{err}")
+
+def setup(folder):
+    transcripts = folder / "transcripts"
+    transcripts.mkdir()
+    for name, content in TRANSCRIPTS.items():
+        text = content if isinstance(content, str) else json.dumps(content)
+        (transcripts / name).write_text(text, encoding="utf-8")
+
+    rng = random.Random(5)
+    files = list(TRANSCRIPTS) + ["missing.json"]
+    rows = [(rng.choice(files), rng.choice(TARGETS)) for _ in range(ROWS)]
+    pd.DataFrame(rows, columns=["Filename", "Target_Text"]).to_excel(folder / "Solutions.xlsx", index=False)
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        full, killed = Path(tmp) / "full", Path(tmp) / "killed"
+        full.mkdir()
+        setup(full)
+        shutil.copytree(full, killed)
+
+        # 1. Uninterrupted run
+        finish(run_grader(full))
+
+        # 2. Run that is killed midway (SIGKILL, no chance to clean up)
+        journal = killed / "Grading_Results.journal.jsonl"
+        process = run_grader(killed)
+        while process.poll() is None:
+            if journal.exists() and journal.read_bytes().count(b"\n") > KILL_AFTER_ROWS:
+                process.kill()
+                break
+            time.sleep(0.05)
+        process.wait()
+        if (killed / "Grading_Results.xlsx").exists():
+            raise AssertionError("Run finished before it could be killed, increase ROWS")
+        graded = journal.read_bytes().count(b"\n{\"row\"")
+        print(f" Killed after {graded} of {ROWS} rows were checkpointed")
+        # Each transcript (and the [MISSING] placeholder) is written once, rows refer to it by ID
+        if journal.read_bytes().count(b"\n{\"transcript\"") > len(TRANSCRIPTS) + 1:
+            raise AssertionError("Journal repeats transcripts")
+
+        # 3. Without --resume the journal must not be overwritten
+        before = journal.read_bytes()
+        finish(run_grader(killed))
+        if journal.read_bytes() != before or (killed / "Grading_Results.xlsx").exists():
+            raise AssertionError("Run without --resume touched the journal")
+
+        # 4. Resume and compare
+        finish(run_grader(killed, "--resume"))
+        expected = pd.read_excel(full / "Grading_Results.xlsx")
+        actual = pd.read_excel(killed / "Grading_Results.xlsx")
+        pd.testing.assert_frame_equal(actual, expected)
+        if journal.exists():
+            raise AssertionError("Journal was not removed after saving")
+
+    print(" Resume: output after kill + --resume equals the uninterrupted run")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+TextSimilarityGrader (https://github.com/robomustib/TextSimilarityGrader/)
+Copyright (c) 2026 Mustafa Bilgin
+Licensed under Creative Commons Attribution-NonCommercial 4.0 International (CC BY-NC 4.0)
+"""
+
+import sys
+from pathlib import Path
+
+# evaluate.py lives in the project root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import evaluate
+
+# Note: Assumes script is run from project root after 'tests/create_test_data.py'
+FILENAME = "test_pear_words.json"
+TARGET = "Pear"
+
+# (settings, expected "Actual (Found Word)", expected points)
+CASES = [
+    ({"USE_WORD_TIMESTAMPS": False}, "pear.", 1),
+    ({"USE_WORD_TIMESTAMPS": True}, "pear. @ 5.12s", 1),
+    # Only 'apple' was said within the first 3 seconds
+    ({"USE_WORD_TIMESTAMPS": True, "RESPONSE_WINDOW": (0.0, 3.0)}, "apple. @ 1.20s", 0),
+    # 'pear' was recognized with confidence 0.52 only
+    ({"USE_WORD_TIMESTAMPS": True, "MIN_WORD_CONFIDENCE": 0.6}, "apple. @ 1.20s", 0),
+]
+
+def main():
+    if not (evaluate.TRANSCRIPT_FOLDER / FILENAME).exists():
+        print(f"ERROR: '{evaluate.TRANSCRIPT_FOLDER / FILENAME}' not found.")
+        print("Please run 'tests/create_test_data.py' first!")
+        sys.exit(1)
+
+    defaults = {"USE_WORD_TIMESTAMPS": False, "RESPONSE_WINDOW": None, "MIN_WORD_CONFIDENCE": None}
+    for settings, expected_word, expected_points in CASES:
+        for name, value in {**defaults, **settings}.items():
+            setattr(evaluate, name, value)
+
+        actual_raw, found, _, words = evaluate.read_transcript(FILENAME)
+        t_clean, similarity, word = evaluate.grade_transcript(TARGET, actual_raw, words)
+        points = evaluate.award_points(t_clean, similarity)
+        if (word, points) != (expected_word, expected_points):
+            raise AssertionError(f"{settings}: got {word!r} / {points} point(s), "
+                                 f"expected {expected_word!r} / {expected_points}")
+        print(f" {str(settings):70} -> {word} ({points} point(s))")
+
+    print(" Word timestamps: window and confidence filter decide the grade as expected")
+
+if __name__ == "__main__":
+    main()
@@ -129,6 +129,37 @@ test_cases = [
             "status": "success"
         }
     },
+    {
+        "filename": "test_pear_words.json",
+        "description": "Expected: 'Pear'. Test: Word timestamps. Says 'apple' within the first 3 s, corrects to 'pear' (low confidence) at 5.1 s.",
+        "content": {
+            "result": {
+                "transcription": {
+                    "full_transcript": "Ehm, an apple. No, a pear.",
+                    "utterances": [
+                        {
+                            "text": "Ehm, an apple.",
+                            "language": "en",
+                            "words": [
+                                {"word": "Ehm,", "start": 0.31, "end": 0.62, "confidence": 0.71},
+                                {"word": " an", "start": 1.05, "end": 1.12, "confidence": 0.93},
+                                {"word": " apple.", "start": 1.20, "end": 1.61, "confidence": 0.97}
+                            ]
+                        },
+                        {
+                            "text": "No, a pear.",
+                            "language": "en",
+                            "words": [
+                                {"word": "No,", "start": 4.80, "end": 4.95, "confidence": 0.95},
+                                {"word": " a", "start": 5.02, "end": 5.08, "confidence": 0.90},
+                                {"word": " pear.", "start": 5.12, "end": 5.40, "confidence": 0.52}
+                            ]
+                        }
+                    ]
+                }
+            }
+        }
+    },
     {
         "filename": "test_dog_utterances.json",
         "description": "Expected: 'Dog'. Test: Only utterances, no full transcript.",
@@ -176,6 +207,7 @@ keyword_map = {
     "test_anna_structure.json": "Anna",
     "test_apple_standard.json": "Apple",
     "test_banana_simple.json": "Banana",
+    "test_pear_words.json": "Pear",
     "test_dog_utterances.json": "Dog"
 }
 